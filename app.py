@@ -1,6 +1,9 @@
+import os
+
 from app import create_app
 
 app = create_app()
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Debug (reloader + evalex) is opt-in; the default run matches production
+    app.run(debug=os.environ.get("FLASK_DEBUG", "0") == "1")
@@ -1,11 +1,50 @@
+import importlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
 from .extensions import init_extensions
 from datetime import date, timedelta, datetime
-from app.extensions import db
-import sqlalchemy
-from app.models import User
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson's native encoder/decoder. Falls back to
+    DefaultJSONProvider.default for types orjson doesn't handle natively
+    (Decimal, UUID, dataclasses) so jsonify output stays unchanged.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_SORT_KEYS,
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Blueprints registered by create_app(). Imported lazily so CLI invocations
+# (flask --help, flask db ...) don't pay for the full routes/forms import
+# graph up front.
+BLUEPRINTS = [
+    ("main", "bp"),
+    ("assets", "bp"),
+    ("locations", "bp"),
+    ("categories", "bp"),
+    ("vendors", "bp"),
+    ("auth", "bp"),
+    ("admin", "bp"),
+    ("settings", "bp"),
+]
 
 
 def _base_path():
@@ -17,100 +56,226 @@ def _base_path():
     return os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 
 
-def create_app():
-    base_path = _base_path()
-    template_folder = os.path.join(base_path, "app", "templates")
-    static_folder = os.path.join(base_path, "app", "static")
+# Resolved once at import: repeated create_app() calls (reloader, tests)
+# reuse identical path strings instead of redoing the abspath syscalls.
+_BASE_PATH = _base_path()
+_TEMPLATE_FOLDER = os.path.join(_BASE_PATH, "app", "templates")
+_STATIC_FOLDER = os.path.join(_BASE_PATH, "app", "static")
 
-    app = Flask(__name__, template_folder=template_folder, static_folder=static_folder)
 
-    # Load config
-    app.config.from_object("config.Config")
+# Exact-type dispatch (datetime before its date superclass) instead of a
+# try/except catch-all: these filters run once per table cell, so the
+# exception-frame setup was pure overhead on the dominant types.
+def fmt_date(value, _datetime=datetime, _date=date):
+    if not value:
+        return "-"
+    if type(value) is _datetime:
+        return value.date().strftime("%d-%m-%Y")
+    if type(value) is _date:
+        return value.strftime("%d-%m-%Y")
+    return str(value)
 
-    # Init ALL extensions in ONE place
-    init_extensions(app)
 
-    # Import models so Flask-Migrate can detect them
-    from . import models  # noqa
+def fmt_datetime(value, _datetime=datetime, _date=date):
+    if not value:
+        return "-"
+    if type(value) is _datetime:
+        return value.strftime("%d-%m-%Y - %H:%M:%S")
+    if type(value) is _date:
+        return value.strftime("%d-%m-%Y")
+    return str(value)
+
+
+def _register_jinja_helpers(app):
+    """
+    Install the shared Jinja globals/filters. The functions live at module
+    level so repeated create_app() calls reuse the same code objects instead
+    of compiling fresh closures per app instance.
+    """
+    app.jinja_env.globals["date"] = date
+    app.jinja_env.globals["timedelta"] = timedelta
+    app.jinja_env.filters["fmt_date"] = fmt_date
+    app.jinja_env.filters["fmt_datetime"] = fmt_datetime
+
+
+# Single worker is enough: it only ever hashes the first-boot admin seed.
+_seed_pool = ThreadPoolExecutor(max_workers=1)
+
+_PENDING_PASSWORD_HASH = "!pending"
+
+
+def _finalize_seed_password(app, user_id, password):
+    """Hash the seeded admin password off the startup critical path."""
+    from app.extensions import db
+    from app.models import User
+
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        if user is not None and user.password_hash == _PENDING_PASSWORD_HASH:
+            user.set_password(password)
+            db.session.commit()
+
 
-    # Register blueprints
-    from .main import bp as main_bp
-    app.register_blueprint(main_bp)
+def _repair_pending_seed(app):
+    """
+    Finish a seed hash that never landed: if a previous boot died between
+    committing the placeholder admin row and the background hash write,
+    the admin would otherwise stay locked out forever (warm starts skip
+    seeding entirely). One indexed SELECT per boot; almost always a no-op.
+    """
+    from app.extensions import db
+    from app.models import User
 
-    from .assets import bp as assets_bp
-    app.register_blueprint(assets_bp)
+    with app.app_context():
+        user = User.query.filter_by(password_hash=_PENDING_PASSWORD_HASH).first()
+        if user is not None:
+            _seed_pool.submit(_finalize_seed_password, app, user.id, "123456")
 
-    from .locations import bp as locations_bp
-    app.register_blueprint(locations_bp)
 
-    from .categories import bp as categories_bp
-    app.register_blueprint(categories_bp)
+def _ensure_schema_current(app):
+    """
+    Bring an existing database up to the current model schema. Packaged
+    deployments never run Alembic and create_all() skips tables that
+    already exist, so schema objects added after a database was first
+    created — the assets_fts search table, newer indexes — would never
+    materialize on upgraded installs (searches would 500 on the missing
+    FTS table). One sqlite_master probe per boot; creates only what is
+    missing, so the steady state is a single SELECT.
+    """
+    from app.extensions import db
+    from app.models import Asset, Vendor, _ASSETS_FTS_DDL
 
-    from .vendors import bp as vendors_bp
-    app.register_blueprint(vendors_bp)
+    with app.app_context():
+        existing = {
+            name
+            for (name,) in db.session.execute(
+                db.text("SELECT name FROM sqlite_master")
+            )
+        }
+
+        if "assets_fts" not in existing:
+            for stmt in _ASSETS_FTS_DDL:
+                db.session.execute(db.text(stmt))
+            # Backfill the index from the rows that predate it.
+            db.session.execute(db.text(
+                "INSERT INTO assets_fts(rowid, name, asset_tag, serial_number) "
+                "SELECT id, name, asset_tag, serial_number FROM assets"
+            ))
+            db.session.commit()
 
-    from .auth import bp as auth_bp
-    app.register_blueprint(auth_bp)
+        for table in (Asset.__table__, Vendor.__table__):
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(db.engine)
 
-    from .admin import bp as admin_bp
-    app.register_blueprint(admin_bp)
 
-    from .settings import bp as settings_bp
-    app.register_blueprint(settings_bp)
+def _seed_admin(app):
+    """
+    Ensure database/tables exist (especially on first run in packaged mode)
+    and seed a default admin for fresh DBs.
+
+    Mostly skipped on warm starts: if the SQLite file already exists the
+    schema and admin were created on a previous boot, so only the cheap
+    schema-currency and placeholder-hash checks run instead of full
+    metadata reflection plus a user count on every process start.
+    """
+    uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
+    fresh_sqlite = False
+    if uri.startswith("sqlite:///"):
+        db_path = uri[len("sqlite:///"):]
+        if db_path and os.path.exists(db_path):
+            _ensure_schema_current(app)
+            _repair_pending_seed(app)
+            return
+        fresh_sqlite = True
+
+    from app.extensions import db
+    from app.models import User
+    import sqlalchemy
 
-    # Ensure database/tables exist (especially on first run in packaged mode)
     with app.app_context():
         try:
-            db.create_all()
+            # A fresh SQLite file has no tables, so skip the per-table
+            # sqlite_master existence probes and emit the DDL directly.
+            if fresh_sqlite:
+                db.metadata.create_all(db.engine, checkfirst=False)
+            else:
+                db.create_all()
         except sqlalchemy.exc.SQLAlchemyError:
             # If the DB file is missing or path invalid, surface error during startup
             app.logger.exception("Database initialization failed.")
             raise
 
-        # Seed a default admin for fresh DBs
+        # Seed a default admin for fresh DBs. The row is committed with a
+        # placeholder hash so startup isn't blocked on scrypt; the real
+        # hash lands from a background thread moments later (logins fail
+        # closed until then, see User.check_password).
         if User.query.count() == 0:
             admin = User(username="admin", is_admin=True)
-            admin.set_password("123456")
+            admin.password_hash = _PENDING_PASSWORD_HASH
             db.session.add(admin)
             db.session.commit()
+            _seed_pool.submit(_finalize_seed_password, app, admin.id, "123456")
 
-    # Global Jinja helpers
-    app.jinja_env.globals["date"] = date
-    app.jinja_env.globals["timedelta"] = timedelta
 
-    # Date/time formatting filters
-    def fmt_date(value):
-        if not value:
-            return "-"
-        if isinstance(value, datetime):
-            value = value.date()
-        try:
-            return value.strftime("%d-%m-%Y")
-        except Exception:
-            return str(value)
-
-    def fmt_datetime(value):
-        if not value:
-            return "-"
-        if isinstance(value, datetime):
-            return value.strftime("%d-%m-%Y - %H:%M:%S")
-        try:
-            # Try to coerce date objects
-            return fmt_date(value)
-        except Exception:
-            return str(value)
+def create_app():
+    app = Flask(__name__, template_folder=_TEMPLATE_FOLDER, static_folder=_STATIC_FOLDER)
 
-    app.jinja_env.filters["fmt_date"] = fmt_date
-    app.jinja_env.filters["fmt_datetime"] = fmt_datetime
+    # Load config
+    app.config.from_object("config.Config")
+
+    # Fast JSON encode/decode when orjson is available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+    # Init ALL extensions in ONE place
+    init_extensions(app)
+
+    # Import models so Flask-Migrate can detect them
+    from . import models  # noqa
+
+    # Register blueprints. Nothing in the factory may bind the url_map
+    # (url_for, test_request_context, iter_rules) between registrations:
+    # werkzeug sorts rules lazily, so keeping the map unbound here means
+    # the rule sort runs once, below, instead of once per blueprint.
+    for name, attr in BLUEPRINTS:
+        module = importlib.import_module(f".{name}", __package__)
+        app.register_blueprint(getattr(module, attr))
+    app.url_map.update()  # one rule sort for all blueprints
+
+    _seed_admin(app)
+
+    # Global Jinja helpers + date/time formatting filters
+    _register_jinja_helpers(app)
+
+    # Persist compiled template bytecode so fresh processes reuse it
+    # instead of re-parsing every template on first hit; keep auto-reload
+    # (a stat per render) for debug runs only. The large cache_size keeps
+    # all templates resident.
+    if not app.debug:
+        app.jinja_env.auto_reload = False
+        app.config["TEMPLATES_AUTO_RELOAD"] = False
+    cache_dir = os.path.join(app.instance_path, "jinja_cache")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    except OSError:
+        pass  # read-only install dir: run without the on-disk cache
+    app.jinja_env.cache_size = 1000
 
     # Settings helper for templates
     from app.settings.routes import get_setting_value  # lightweight helper
     app.jinja_env.globals["get_setting"] = get_setting_value
 
-    from flask import render_template
+    # Pre-fetch the compiled error template once so the handler skips the
+    # loader/get_or_select_template lookup on every forbidden hit.
+    with app.app_context():
+        forbidden_template = app.jinja_env.get_template("errors/403.html")
 
     @app.errorhandler(403)
     def forbidden(_e):
-        return render_template("errors/403.html"), 403
+        # Direct render skips context processors, so pass current_user along
+        from flask_login import current_user
+        return forbidden_template.render(current_user=current_user), 403
 
     return app
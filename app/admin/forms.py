@@ -9,8 +9,7 @@ class UserCreateForm(FlaskForm):
 
 class PasswordResetForm(FlaskForm):
     password = PasswordField("New Password", validators=[DataRequired(), Length(min=6)])
-    
-from flask_wtf import FlaskForm
+
 
 class EmptyForm(FlaskForm):
     pass
\ No newline at end of file
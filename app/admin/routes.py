@@ -1,7 +1,9 @@
 from flask import render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
+from sqlalchemy import update
+from werkzeug.security import generate_password_hash
 from . import bp
-from app.models import User
+from app.models import User, PASSWORD_HASH_METHOD
 from app.extensions import db
 from app.utils.decorators import admin_required
 from .forms import UserCreateForm, PasswordResetForm, EmptyForm
@@ -10,7 +12,14 @@ from .forms import UserCreateForm, PasswordResetForm, EmptyForm
 @login_required
 @admin_required
 def list_users():
-    users = User.query.order_by(User.username).all()
+    # The table only shows id/username/is_admin; fetch those columns as
+    # lightweight row tuples instead of hydrating full User objects.
+    users = (
+        User.query
+        .with_entities(User.id, User.username, User.is_admin)
+        .order_by(User.username)
+        .all()
+    )
     form = EmptyForm()
     return render_template("admin/users/list.html", users=users, form=form)
 
@@ -18,27 +27,39 @@ def list_users():
 @login_required
 @admin_required
 def toggle_admin(user_id):
-    user = User.query.get_or_404(user_id)
-
-    if user.id == current_user.id:
+    if user_id == current_user.id:
         flash("You cannot change your own admin status.", "danger")
         return redirect(url_for("admin.list_users"))
 
-    user.is_admin = not user.is_admin
+    # Single-column flip: issue an UPDATE directly instead of hydrating the
+    # full User object just to invert one boolean.
+    result = db.session.execute(
+        update(User).where(User.id == user_id).values(is_admin=~User.is_admin)
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
+        flash("User not found.", "danger")
+        return redirect(url_for("admin.list_users"))
     db.session.commit()
 
-    flash(f"Admin status updated for {user.username}.", "success")
+    flash("Admin status updated.", "success")
     return redirect(url_for("admin.list_users"))
 
 @bp.route("/users/<int:user_id>/reset-password", methods=["GET", "POST"])
 @login_required
 @admin_required
 def reset_password(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     form = PasswordResetForm()
 
     if form.validate_on_submit():
-        user.set_password(form.password.data)
+        # Column-only UPDATE: the hash is computed up front, no need to
+        # dirty-track the loaded object for a single field write.
+        db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(password_hash=generate_password_hash(form.password.data, method=PASSWORD_HASH_METHOD))
+        )
         db.session.commit()
         flash("Password reset successfully.", "success")
         return redirect(url_for("admin.list_users"))
@@ -74,7 +95,7 @@ def create_user():
 @login_required
 @admin_required
 def delete_user(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
 
     if user.id == current_user.id:
         flash("You cannot delete your own account.", "danger")
@@ -0,0 +1,142 @@
+"""
+Cached dropdown choices for the asset form.
+
+The four lookup tables (locations, categories, subcategories, vendors)
+change rarely but were queried on every asset create/edit GET and POST.
+Choice lists are cached per process, keyed on a cheap version fingerprint
+(row count + max updated_at per table) so stale entries drop out as soon
+as a lookup table changes.
+"""
+
+from functools import lru_cache
+
+from flask import g, has_app_context
+from sqlalchemy import event, func, literal, select, union_all
+
+from app.extensions import db
+from app.models import Category, Location, SubCategory, Vendor
+
+_PLACEHOLDER = (0, "--- Select ---")
+
+
+def _lookup_version():
+    """
+    Fingerprint the lookup tables in a single round-trip. Counts catch
+    deletes that max(updated_at) alone would miss.
+    """
+    stmt = select(
+        select(func.count(Location.id)).scalar_subquery(),
+        select(func.max(Location.updated_at)).scalar_subquery(),
+        select(func.count(Category.id)).scalar_subquery(),
+        select(func.max(Category.updated_at)).scalar_subquery(),
+        select(func.count(SubCategory.id)).scalar_subquery(),
+        select(func.max(SubCategory.updated_at)).scalar_subquery(),
+        select(func.count(Vendor.id)).scalar_subquery(),
+        select(func.max(Vendor.updated_at)).scalar_subquery(),
+    )
+    return tuple(db.session.execute(stmt).first())
+
+
+@lru_cache(maxsize=4)
+def _choices_for_version(version):
+    # Choices only need (id, label) pairs, so project plain tuples, and
+    # fetch all four lists with one UNION ALL round-trip instead of four;
+    # rows are partitioned back into their lists by the kind tag. The
+    # subcategory branch joins Category explicitly for its label rather
+    # than lazy-loading sc.category per row. A shared ORDER BY on the
+    # name column keeps every list name-sorted like the old queries.
+    stmt = union_all(
+        select(
+            literal("loc").label("kind"),
+            Location.id.label("id"),
+            Location.name.label("name"),
+            literal(None).label("parent"),
+        ),
+        select(literal("cat"), Category.id, Category.name, literal(None)),
+        select(
+            literal("sub"), SubCategory.id, SubCategory.name, Category.name
+        ).join_from(SubCategory, Category, Category.id == SubCategory.category_id),
+        select(literal("ven"), Vendor.id, Vendor.name, literal(None)),
+    ).order_by("name")
+
+    buckets = {"loc": [], "cat": [], "sub": [], "ven": []}
+    for kind, row_id, name, parent in db.session.execute(stmt):
+        if kind == "sub":
+            buckets[kind].append((row_id, f"{parent} - {name}"))
+        else:
+            buckets[kind].append((row_id, name))
+
+    return (
+        [_PLACEHOLDER] + buckets["loc"],
+        [_PLACEHOLDER] + buckets["cat"],
+        [_PLACEHOLDER] + buckets["sub"],
+        [_PLACEHOLDER] + buckets["ven"],
+    )
+
+
+@lru_cache(maxsize=4)
+def _subcategory_options_for_version(version):
+    # Payload for the create/edit form's dependent-dropdown script; the
+    # outer join keeps orphan-category rows visible like the old
+    # per-object loop did.
+    rows = (
+        db.session.query(
+            SubCategory.id, SubCategory.name, SubCategory.category_id, Category.name
+        )
+        .outerjoin(Category, Category.id == SubCategory.category_id)
+        .order_by(SubCategory.name)
+        .all()
+    )
+    return [
+        {
+            "id": sc_id,
+            "name": sc_name,
+            "category_id": cat_id,
+            "label": f"{cat_name} - {sc_name}" if cat_name else sc_name,
+        }
+        for sc_id, sc_name, cat_id, cat_name in rows
+    ]
+
+
+def _current_version():
+    """Version fingerprint, memoized in flask.g so a request computes it once."""
+    if has_app_context():
+        if "_choices_version" not in g:
+            g._choices_version = _lookup_version()
+        return g._choices_version
+    return _lookup_version()
+
+
+def get_form_choices():
+    """Return (location, category, subcategory, vendor) choice lists."""
+    return _choices_for_version(_current_version())
+
+
+def get_subcategory_options():
+    """Return the dependent-dropdown payload for the asset form script."""
+    return _subcategory_options_for_version(_current_version())
+
+
+def get_location_filters():
+    """
+    Return name-ordered (id, name) location pairs for filter dropdowns —
+    the cached form choice list minus its placeholder entry.
+    """
+    return _choices_for_version(_current_version())[0][1:]
+
+
+def invalidate_choices():
+    """Drop all cached choice lists (used by lookup-table CRUD routes)."""
+    _choices_for_version.cache_clear()
+    _subcategory_options_for_version.cache_clear()
+
+
+def _on_lookup_write(*_args, **_kwargs):
+    invalidate_choices()
+
+
+# Any in-process write to a lookup table drops the cache immediately; the
+# version fingerprint still guards against writes from other processes.
+for _model in (Location, Category, SubCategory, Vendor):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _on_lookup_write)
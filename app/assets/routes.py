@@ -1,19 +1,24 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from collections import defaultdict
+from datetime import date
 import io
 import csv
-from decimal import Decimal
+import re
+from decimal import Decimal, InvalidOperation
 from typing import Optional
 
-from flask import render_template, redirect, url_for, flash, request, abort
+from flask import render_template, redirect, url_for, flash, request, abort, g, has_request_context
 from flask_login import login_required, current_user
-from sqlalchemy import func
+from sqlalchemy import func, insert, select, text, update, Integer
+from sqlalchemy.orm import contains_eager, joinedload, load_only, selectinload
+from flask_sqlalchemy.pagination import QueryPagination
 
 from . import bp
+from .choices import get_form_choices, get_location_filters, get_subcategory_options
 from .forms import AssetForm
 from app.extensions import db
-from app.models import Asset, Location, Category, SubCategory, Vendor, AssetEvent, AssetTagSequence, Setting
+from app.models import Asset, Location, Category, SubCategory, Vendor, AssetEvent, Setting
 from app.auth.decorators import admin_required
 
 
@@ -26,8 +31,10 @@ def _company_prefix() -> str:
     Retrieve the asset tag prefix from settings. Strips trailing dashes/spaces
     and uppercases for consistency. Defaults to ESS.
     """
-    setting = Setting.query.filter_by(key="asset_tag_prefix").first()
-    prefix = (setting.value if setting else "ESS").strip() if setting else "ESS"
+    # Local import: settings.routes imports EXPORT_HEADERS from this module.
+    from app.settings.routes import get_setting_value
+
+    prefix = get_setting_value("asset_tag_prefix", "ESS").strip()
     if prefix.endswith("-"):
         prefix = prefix[:-1]
     if not prefix:
@@ -36,36 +43,83 @@ def _company_prefix() -> str:
 
 def _max_existing_seq_for_office_year(office_code: str, year: int) -> int:
     """
-    Scan existing asset tags to find the max sequence for an office/year.
-    This is used to initialize/repair the counter when the sequence table is
-    created after assets already exist.
+    Find the max tag sequence for an office/year with a single SQL
+    aggregate. This is used to initialize/repair the counter when the
+    sequence table is created after assets already exist.
     """
     company_prefix = _company_prefix()
     year_str = str(year)
-    max_seq = 0
 
-    # pattern: ESS-{office}-{category}-{year}-{seq}
-    pattern = f"{company_prefix}-{office_code}-%-{year_str}-%"
-    tags = (
-        Asset.query
-        .with_entities(Asset.asset_tag)
-        .filter(Asset.asset_tag.like(pattern))
-        .all()
+    # pattern: ESS-{office}-{category}-{year}-{seq}; the sequence is
+    # whatever follows the "-{year}-" marker, so extract and MAX it in
+    # the database instead of shipping every tag to Python.
+    #
+    # SQLite's LIKE is case-insensitive for ASCII, so on its own it cannot
+    # use the unique index on asset_tag. Tags are uppercase by construction
+    # (generator and CSV import both normalize), so bound the scan with an
+    # explicit range on the literal prefix — that gives the planner an
+    # index range scan — and keep LIKE only for the "-{year}-" marker.
+    prefix = f"{company_prefix}-{office_code}-"
+    pattern = f"{prefix}%-{year_str}-%"
+    marker = f"-{year_str}-"
+    seq_expr = func.cast(
+        func.substr(Asset.asset_tag, func.instr(Asset.asset_tag, marker) + len(marker)),
+        Integer,
     )
-    for (tag,) in tags:
-        parts = (tag or "").split("-")
-        if len(parts) < 5:
-            continue
-        # quick sanity: ESS, office, cat, year, seq
-        if parts[0] != company_prefix or parts[1] != office_code or parts[-2] != year_str:
-            continue
-        try:
-            seq_val = int(parts[-1])
-            if seq_val > max_seq:
-                max_seq = seq_val
-        except ValueError:
-            continue
-    return max_seq
+    return (
+        db.session.query(func.coalesce(func.max(seq_expr), 0))
+        .filter(
+            Asset.asset_tag >= prefix,
+            Asset.asset_tag < prefix + "\x7f",
+            Asset.asset_tag.like(pattern),
+        )
+        .scalar()
+    )
+
+
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+def _parse_iso_date(val: str) -> Optional[date]:
+    """
+    Parse a YYYY-MM-DD string; None for anything malformed. The regex +
+    date() path is much cheaper than strptime and runs once per date cell
+    of every imported row.
+    """
+    m = _ISO_DATE_RE.match(val)
+    if not m:
+        return None
+    try:
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    except ValueError:
+        return None
+
+
+def _looks_like_full_tag(q: str) -> bool:
+    """
+    True when a search term has the shape of a complete generated tag
+    (PREFIX-OFFICE-CAT-YEAR-SEQ), e.g. ESS-M-COMP-2025-0001. Requires the
+    configured company prefix, not just the dash/digit shape: otherwise a
+    serial number like SN-01-02-2024-0123 would be forced onto the
+    tag-equality fast path and silently match nothing.
+    """
+    parts = q.split("-")
+    if len(parts) < 5 or not (parts[-1].isdigit() and parts[-2].isdigit()):
+        return False
+    return q.upper().startswith(_company_prefix() + "-")
+
+
+def _today() -> date:
+    """
+    date.today(), computed at most once per request. The date can't change
+    mid-request in any way we care about, and handlers (especially the CSV
+    import loop) otherwise hit the underlying time syscall repeatedly.
+    """
+    if has_request_context():
+        if "_today" not in g:
+            g._today = date.today()
+        return g._today
+    return date.today()
 
 
 def _normalize_id(value):
@@ -74,67 +128,58 @@ def _normalize_id(value):
 
 
 def _populate_form_choices(form: AssetForm):
-    """Populate dropdown choices for the asset form."""
-    locations = Location.query.order_by(Location.name).all()
-    categories = Category.query.order_by(Category.name).all()
-    subcategories = SubCategory.query.order_by(SubCategory.name).all()
-    vendors = Vendor.query.order_by(Vendor.name).all()
-
-    form.location_id.choices = [(0, "--- Select ---")] + [(loc.id, loc.name) for loc in locations]
-    form.category_id.choices = [(0, "--- Select ---")] + [(cat.id, cat.name) for cat in categories]
-    form.subcategory_id.choices = [(0, "--- Select ---")] + [
-        (sc.id, f"{sc.category.name} - {sc.name}") for sc in subcategories
-    ]
-    form.vendor_id.choices = [(0, "--- Select ---")] + [(v.id, v.name) for v in vendors]
-
-
-def _get_or_create_sequence(office_code: str, year: int) -> AssetTagSequence:
+    """Populate dropdown choices for the asset form (cached, see choices.py)."""
+    (
+        form.location_id.choices,
+        form.category_id.choices,
+        form.subcategory_id.choices,
+        form.vendor_id.choices,
+    ) = get_form_choices()
+
+
+_NEXT_SEQ_SQL = text(
+    "INSERT INTO asset_tag_sequences (office_code, year, last_seq) "
+    "VALUES (:office_code, :year, :count) "
+    "ON CONFLICT (office_code, year) "
+    "DO UPDATE SET last_seq = asset_tag_sequences.last_seq + :count "
+    "RETURNING last_seq"
+)
+
+_SEED_SEQ_SQL = text(
+    "UPDATE asset_tag_sequences SET last_seq = :last_seq "
+    "WHERE office_code = :office_code AND year = :year "
+    "RETURNING last_seq"
+)
+
+
+def _next_sequence_value(office_code: str, year: int, count: int = 1) -> int:
     """
-    Fetch or create the sequence tracker for an office/year.
-    Uses with_for_update to reduce race conditions on DBs that support it.
+    Atomically allocate ``count`` consecutive tag sequence values for an
+    office/year via a single upsert, returning the first value of the
+    block: concurrent creators each get distinct values without
+    SELECT ... FOR UPDATE round-trips. The upsert's conflict target rides
+    the uq_asset_tag_seq_office_year unique constraint, so the probe is an
+    index lookup. A missing table is a deploy bug — the factory creates
+    the schema on first boot — so there is no create_all fallback here.
+
+    The legacy-tag repair scan below only runs when the upsert created the
+    counter (new_last == count), i.e. once per office/year ever; the
+    steady state is exactly one statement per allocation, block or not.
     """
-    from sqlalchemy.exc import OperationalError
+    params = {"office_code": office_code, "year": year, "count": count}
+    new_last = db.session.execute(_NEXT_SEQ_SQL, params).scalar()
 
-    seq = None
-    try:
-        seq = (
-            AssetTagSequence.query
-            .filter_by(office_code=office_code, year=year)
-            .with_for_update()
-            .first()
-        )
-    except OperationalError as exc:
-        # Fallback for missing table (e.g., migration not applied yet)
-        if "no such table" in str(exc).lower() and "asset_tag_sequences" in str(exc).lower():
-            db.session.rollback()
-            db.create_all()
-            seq = (
-                AssetTagSequence.query
-                .filter_by(office_code=office_code, year=year)
-                .with_for_update()
-                .first()
-            )
-        else:
-            raise
-
-    if not seq:
-        seq = AssetTagSequence(office_code=office_code, year=year, last_seq=0)
-        db.session.add(seq)
-        # Initialize from existing tags if any were created before this table existed
+    if new_last == count:
+        # Fresh counter: fold in tags created before the sequence table existed
         existing_max = _max_existing_seq_for_office_year(office_code, year)
         if existing_max > 0:
-            seq.last_seq = existing_max
-        db.session.flush()
-    else:
-        # Repair in case the stored last_seq lags behind real tags
-        existing_max = _max_existing_seq_for_office_year(office_code, year)
-        if existing_max > seq.last_seq:
-            seq.last_seq = existing_max
-            db.session.flush()
-    return seq
+            new_last = db.session.execute(
+                _SEED_SEQ_SQL, dict(params, last_seq=existing_max + count)
+            ).scalar()
+    return new_last - count + 1
 
 
-def generate_asset_tag(location: Location, category: Category, year: int) -> str:
+def generate_asset_tag(office_code: Optional[str], cat_code: Optional[str], year: int) -> str:
     """
     Format:
       ESS-{OfficeCode}-{CategoryCode}-{Year}-{0001}
@@ -142,62 +187,37 @@ def generate_asset_tag(location: Location, category: Category, year: int) -> str
     Example:
       ESS-M-COMP-2025-0001
 
-    Sequencing rule: sequence is per Office+Year (shared across all categories
-    for that office/year) and never reuses numbers even if assets are deleted.
+    Takes the raw Location/Category codes so callers that only need a tag
+    don't have to load full rows. Sequencing rule: sequence is per
+    Office+Year (shared across all categories for that office/year) and
+    never reuses numbers even if assets are deleted.
     """
     company = _company_prefix()
 
-    office_code = (location.code or "").strip().upper()
-    cat_code = (category.code or "").strip().upper()
+    office_code = (office_code or "").strip().upper()
+    cat_code = (cat_code or "").strip().upper()
 
     if not office_code:
         raise ValueError("Location.code missing (expected M/P).")
     if not cat_code:
         raise ValueError("Category.code missing (expected COMP/MONI etc.).")
 
-    seq = _get_or_create_sequence(office_code, year)
-    next_seq = seq.last_seq + 1
-    seq.last_seq = next_seq
-
-    year_str = str(year)
-    return f"{company}-{office_code}-{cat_code}-{year_str}-{next_seq:04d}"
+    # Everything but the sequence is invariant, so build the prefix before
+    # the round-trip and append the zero-padded counter afterwards.
+    prefix = f"{company}-{office_code}-{cat_code}-{year}-"
+    next_seq = _next_sequence_value(office_code, year)
+    return prefix + format(next_seq, "04d")
 
 
-def ensure_vendor_code(vendor: Vendor):
-    """
-    Ensure a vendor has a code; auto-generate if missing.
-    """
-    if not vendor or vendor.code:
-        return
-
-    existing_codes = Vendor.query.with_entities(Vendor.code).filter(Vendor.code.isnot(None)).all()
-    max_num = 0
-    for (code,) in existing_codes:
-        if not code:
-            continue
-        code_upper = code.upper().strip()
-        if code_upper.startswith("V") and code_upper[1:].isdigit():
-            max_num = max(max_num, int(code_upper[1:]))
-
-    vendor.code = f"V{max_num + 1:03d}"
-    db.session.commit()
-
 def _next_vendor_code_value():
     """
-    Compute the next vendor code (V###) without committing or mutating records.
+    Compute the next vendor code (V###) without committing or mutating
+    records. Delegates to the vendors blueprint, which finds the current
+    max suffix with a single SQL aggregate.
     """
-    existing_codes = Vendor.query.with_entities(Vendor.code).filter(Vendor.code.isnot(None)).all()
-    max_num = 0
-    for (code,) in existing_codes:
-        if not code:
-            continue
-        code_upper = code.upper().strip()
-        if code_upper.startswith("V") and code_upper[1:].isdigit():
-            try:
-                max_num = max(max_num, int(code_upper[1:]))
-            except ValueError:
-                continue
-    return f"V{max_num + 1:03d}"
+    from app.vendors.routes import _generate_vendor_code
+
+    return _generate_vendor_code()
 
 
 def log_asset_event(
@@ -208,107 +228,356 @@ def log_asset_event(
     to_status: Optional[str] = None,
     from_location_id: Optional[int] = None,
     to_location_id: Optional[int] = None,
+    performed_by_id: Optional[int] = None,
 ):
     """
     Add an AssetEvent row. Caller commits.
+
+    Events are append-only and never read back in the writing request, so
+    for assets that already have an id the row goes through a Core INSERT,
+    skipping unit-of-work bookkeeping (identity map, relationship cascade,
+    attribute instrumentation). Unflushed assets — create/import, where the
+    id isn't assigned yet — still attach through the relationship so the FK
+    resolves in the same flush as the asset INSERT.
+
+    Loops logging many events should resolve current_user.id once and pass
+    performed_by_id explicitly to skip the LocalProxy hop per event.
     """
+    if performed_by_id is None and current_user.is_authenticated:
+        performed_by_id = current_user.id
+    if asset.id is not None:
+        db.session.execute(
+            insert(AssetEvent).values(
+                asset_id=asset.id,
+                event_type=event_type,
+                note=note,
+                from_status=from_status,
+                to_status=to_status,
+                from_location_id=from_location_id,
+                to_location_id=to_location_id,
+                performed_by_id=performed_by_id,
+            )
+        )
+        return
     ev = AssetEvent(
-        asset_id=asset.id,
+        asset=asset,
         event_type=event_type,
         note=note,
         from_status=from_status,
         to_status=to_status,
         from_location_id=from_location_id,
         to_location_id=to_location_id,
-        performed_by_id=current_user.id if current_user.is_authenticated else None,
+        performed_by_id=performed_by_id,
     )
     db.session.add(ev)
 
 
+def bulk_change_status(
+    asset_ids,
+    new_status: str,
+    event_type: str,
+    note: Optional[str] = None,
+    performed_by_id: Optional[int] = None,
+) -> int:
+    """
+    Transition many assets to new_status in three statements regardless of
+    count: one SELECT of the affected rows (for from_status/location on the
+    events), one bulk UPDATE, and one executemany event INSERT. Assets
+    already in new_status are skipped. Caller commits. Returns the number
+    of assets changed.
+    """
+    if not asset_ids:
+        return 0
+
+    if performed_by_id is None and has_request_context() and current_user.is_authenticated:
+        performed_by_id = current_user.id
+
+    rows = db.session.execute(
+        select(Asset.id, Asset.status, Asset.location_id)
+        .where(Asset.id.in_(asset_ids), Asset.status != new_status)
+    ).all()
+    if not rows:
+        return 0
+
+    db.session.execute(
+        update(Asset)
+        .where(Asset.id.in_([row.id for row in rows]))
+        .values(status=new_status)
+    )
+    log_asset_events_bulk(
+        [
+            {
+                "asset_id": row.id,
+                "event_type": event_type,
+                "note": note,
+                "from_status": row.status,
+                "to_status": new_status,
+                "from_location_id": row.location_id,
+                "to_location_id": row.location_id,
+                "performed_by_id": performed_by_id,
+            }
+            for row in rows
+        ]
+    )
+    return len(rows)
+
+
+def log_asset_events_bulk(event_mappings):
+    """
+    Append many AssetEvent rows in one executemany INSERT. Caller commits.
+
+    Mappings use AssetEvent column names; missing keys fall back to column
+    defaults. Use this from any path that logs more than a handful of
+    events per request instead of looping log_asset_event.
+    """
+    if event_mappings:
+        db.session.execute(insert(AssetEvent), event_mappings)
+
+
 # ----------------------------
 # Routes
 # ----------------------------
 
+PER_PAGE = 50  # assets per list page
+MAX_PER_PAGE = 200  # ceiling for the per_page query arg
+
+
+@bp.after_request
+def _make_gets_conditional(response):
+    """
+    Tag GET responses with an ETag and honor If-None-Match so repeat visits
+    to unchanged list/detail pages get a bodiless 304. A server-side page
+    cache was deliberately not used: every page embeds per-session CSRF
+    tokens and one-shot flash messages, so cached HTML would go stale or
+    leak between users.
+    """
+    if (
+        request.method == "GET"
+        and response.status_code == 200
+        and not response.direct_passthrough
+        and not response.is_streamed
+    ):
+        response.add_etag()
+        return response.make_conditional(request)
+    return response
+
+# Display names/badge colors per status, including legacy values; the
+# list view resolves these in Python so the template doesn't rebuild the
+# maps per row.
+STATUS_LABELS = {
+    "in_stock": "In Stock",
+    "assigned": "Assigned",
+    "repair": "Repair",
+    "damaged": "Damaged",
+    "missing": "Missing",
+    "disposed": "Disposed",
+    "retired": "Retired (legacy)",
+    "under_repair": "Under Repair (legacy)",
+    "in_use": "Assigned (legacy)",
+}
+
+STATUS_COLORS = {
+    "in_stock": "success",
+    "assigned": "primary",
+    "repair": "warning",
+    "damaged": "danger",
+    "missing": "secondary",
+    "disposed": "dark",
+    "retired": "secondary",
+    "under_repair": "warning",
+    "in_use": "primary",
+}
+
+# Whitelist of sortable columns; anything else falls back to id so
+# arbitrary query strings can't select unexpected expressions.
+_SORT_COLUMNS = {
+    "id": Asset.id,
+    "asset_tag": Asset.asset_tag,
+    "name": Asset.name,
+    "status": Asset.status,
+    "purchase_date": Asset.purchase_date,
+    "warranty_expiry_date": Asset.warranty_expiry_date,
+    "category": Category.name,
+    "subcategory": SubCategory.name,
+    "location": Location.name,
+    "created_at": Asset.created_at,
+}
+
+# Status filter options never change at runtime; build them once.
+STATUS_CHOICES = (
+    ("", "All statuses"),
+    ("in_stock", "In Stock"),
+    ("assigned", "Assigned"),
+    ("repair", "Repair"),
+    ("damaged", "Damaged"),
+    ("missing", "Missing"),
+    ("disposed", "Disposed"),
+)
+
+
+class _AssetListPagination(QueryPagination):
+    """
+    QueryPagination whose COUNT skips the list query's three display
+    joins. The joins target unique primary keys, so they never change the
+    row count, and every list filter references assets columns only; the
+    caller passes a plain ``select(count())`` over assets with the same
+    filters, which avoids re-planning the joined statement (and its full
+    column list) just to count rows.
+    """
+
+    def _query_count(self) -> int:
+        return db.session.execute(self._query_args["count_select"]).scalar()
+
+
 @bp.route("/")
 @login_required
 def list_assets():
-    status = request.args.get("status", "").strip()
-    location_id = request.args.get("location_id", "").strip()
-    q = request.args.get("q", "").strip()
-    sort = request.args.get("sort", "id").strip()
-    direction = request.args.get("dir", "desc").strip().lower()
-    export = request.args.get("export", "").strip()
+    # Parse and normalize the filter args once, up front: unknown sort
+    # keys and directions collapse to the defaults here so neither the
+    # query nor the template's sort links ever carry junk values.
+    args = request.args
+    status = args.get("status", "").strip()
+    location_id = args.get("location_id", "").strip()
+    q = args.get("q", "").strip()
+    sort = args.get("sort", "id").strip()
+    if sort not in _SORT_COLUMNS:
+        sort = "id"
+    direction = args.get("dir", "desc").strip().lower()
+    if direction != "asc":
+        direction = "desc"
+    export = args.get("export", "").strip()
 
     query = (
         Asset.query
         .outerjoin(Category, Asset.category_id == Category.id)
         .outerjoin(SubCategory, Asset.subcategory_id == SubCategory.id)
         .outerjoin(Location, Asset.location_id == Location.id)
+        # Each row reads its category/subcategory/location; eager-load
+        # them so rendering doesn't fire a lazy SELECT per cell (classic
+        # N+1). They ride the outer joins already in place for
+        # filtering/sorting via contains_eager instead of adding a second
+        # copy of each join.
+        .options(
+            contains_eager(Asset.category),
+            contains_eager(Asset.subcategory),
+            contains_eager(Asset.location),
+        )
     )
 
+    # Every filter references assets columns only; collected as a list so
+    # the join-free count query below can reuse them verbatim.
+    filters = []
     if status:
         if status == "assigned":
-            query = query.filter(Asset.status.in_(["assigned", "in_use"]))
+            filters.append(Asset.status.in_(["assigned", "in_use"]))
         else:
-            query = query.filter(Asset.status == status)
+            filters.append(Asset.status == status)
 
     if location_id and location_id.isdigit():
-        query = query.filter(Asset.location_id == int(location_id))
+        filters.append(Asset.location_id == int(location_id))
 
     if q:
-        like_pattern = f"%{q}%"
-        query = query.filter(
-            db.or_(
-                Asset.name.ilike(like_pattern),
-                Asset.asset_tag.ilike(like_pattern),
-                Asset.serial_number.ilike(like_pattern),
+        if _looks_like_full_tag(q):
+            # Full tags are generated uppercase; equality rides the unique
+            # asset_tag index instead of three leading-wildcard scans.
+            filters.append(Asset.asset_tag == q.upper())
+        else:
+            # assets_fts is a trigram FTS5 mirror of the three searched
+            # columns (see models.py). LIKE over its columns keeps plain
+            # infix-substring, case-insensitive semantics but is answered
+            # from the trigram index instead of scanning assets; patterns
+            # under three characters degrade to a scan of the narrow FTS
+            # table, which is no worse than the old three-column LIKE.
+            like_pattern = f"%{q}%"
+            fts_rowids = (
+                text(
+                    "SELECT rowid FROM assets_fts "
+                    "WHERE name LIKE :fts_pat OR asset_tag LIKE :fts_pat "
+                    "OR serial_number LIKE :fts_pat"
+                )
+                .bindparams(fts_pat=like_pattern)
+                .columns(rowid=Integer)
             )
-        )
+            filters.append(Asset.id.in_(fts_rowids))
+
+    if filters:
+        query = query.filter(*filters)
 
-    sort_map = {
-        "id": Asset.id,
-        "asset_tag": Asset.asset_tag,
-        "name": Asset.name,
-        "status": Asset.status,
-        "purchase_date": Asset.purchase_date,
-        "warranty_expiry_date": Asset.warranty_expiry_date,
-        "category": Category.name,
-        "subcategory": SubCategory.name,
-        "location": Location.name,
-        "created_at": Asset.created_at,
-    }
-
-    sort_col = sort_map.get(sort, Asset.id)
+    sort_col = _SORT_COLUMNS[sort]
     sort_func = sort_col.desc if direction == "desc" else sort_col.asc
-    assets = query.order_by(sort_func()).all()
+    query = query.order_by(sort_func())
 
-    # Handle export toggle quickly (admin only)
+    # Handle export toggle quickly (admin only); exports always cover the
+    # full filtered set, not just the current page
     if export == "csv":
         if not current_user.is_authenticated or not current_user.is_admin:
             abort(403)
-        return export_assets_csv(assets)
+        # The CSV needs vendor names too; Vendor isn't in the join chain,
+        # so it gets one extra IN query per yield_per batch.
+        return export_assets_csv(query.options(selectinload(Asset.vendor)))
+
+    # The table itself renders only a handful of columns; defer the wide
+    # text fields (description, notes, assignment and repair details) and
+    # narrow the eager loads to the one name column each row displays.
+    # The export branch above keeps full rows since the CSV needs them.
+    query = query.options(
+        load_only(
+            Asset.asset_tag,
+            Asset.name,
+            Asset.status,
+            Asset.purchase_date,
+            Asset.warranty_expiry_date,
+        ),
+        contains_eager(Asset.category).load_only(Category.name),
+        contains_eager(Asset.subcategory).load_only(SubCategory.name),
+        contains_eager(Asset.location).load_only(Location.name),
+    )
 
-    locations = Location.query.order_by(Location.name).all()
-    status_choices = [
-        ("", "All statuses"),
-        ("in_stock", "In Stock"),
-        ("assigned", "Assigned"),
-        ("repair", "Repair"),
-        ("damaged", "Damaged"),
-        ("missing", "Missing"),
-        ("disposed", "Disposed"),
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", PER_PAGE, type=int)
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    pagination = _AssetListPagination(
+        query=query,
+        count_select=select(func.count(Asset.id)).where(*filters),
+        page=page,
+        per_page=per_page,
+        # per_page is already clamped to 1..MAX_PER_PAGE above; without
+        # this, the constructor's default max_per_page=100 re-clamps it.
+        max_per_page=MAX_PER_PAGE,
+        error_out=False,
+    )
+
+    # Flatten each row to a plain dict (attribute access + per-cell guards
+    # resolved once here instead of per render in Jinja); the eager loads
+    # above mean this loop stays free of lazy SELECTs.
+    rows = [
+        {
+            "id": a.id,
+            "tag": a.asset_tag,
+            "name": a.name,
+            "category": a.category.name if a.category else "-",
+            "subcategory": a.subcategory.name if a.subcategory else "-",
+            "location": a.location.name if a.location else "-",
+            "status_label": STATUS_LABELS.get(a.status, a.status),
+            "status_color": STATUS_COLORS.get(a.status, "secondary"),
+            "purchase_date": a.purchase_date,
+            "warranty_expiry_date": a.warranty_expiry_date,
+        }
+        for a in pagination.items
     ]
 
     return render_template(
         "assets/list.html",
-        assets=assets,
+        rows=rows,
+        pagination=pagination,
         status=status,
         location_id=location_id,
         q=q,
-        locations=locations,
-        status_choices=status_choices,
+        locations=get_location_filters(),
+        status_choices=STATUS_CHOICES,
         sort=sort,
         direction=direction,
+        per_page=per_page,
     )
 
 
@@ -320,7 +589,7 @@ def create_asset():
 
     # Default purchase date to today on initial load
     if request.method == "GET" and not form.purchase_date.data:
-        form.purchase_date.data = date.today()
+        form.purchase_date.data = _today()
 
     if form.validate_on_submit():
         # We must have Location + Category to generate tag
@@ -328,15 +597,17 @@ def create_asset():
         category_id = _normalize_id(form.category_id.data)
         action = request.form.get("action", "save")
 
-        location = Location.query.get(location_id) if location_id else None
-        category = Category.query.get(category_id) if category_id else None
-
-        if not location or not category:
+        if not location_id or not category_id:
             flash("Location and Category are required to generate Asset Tag.", "danger")
             return render_template("assets/create.html", form=form)
 
+        # Only the code columns are needed for tag generation; index-only
+        # scalar fetches instead of loading the full rows.
+        location_code = db.session.query(Location.code).filter_by(id=location_id).scalar()
+        category_code = db.session.query(Category.code).filter_by(id=category_id).scalar()
+
         try:
-            asset_tag = generate_asset_tag(location, category, date.today().year)
+            asset_tag = generate_asset_tag(location_code, category_code, _today().year)
         except ValueError as exc:
             flash(str(exc), "danger")
             return render_template("assets/create.html", form=form)
@@ -358,7 +629,6 @@ def create_asset():
         )
 
         db.session.add(asset)
-        db.session.flush()  # ensure asset.id exists
 
         log_asset_event(
             asset=asset,
@@ -377,24 +647,15 @@ def create_asset():
     if form.errors:
         flash("Please correct the errors in the form.", "danger")
 
-    subcategories = SubCategory.query.order_by(SubCategory.name).all()
-    subcategory_options = [
-        {
-            "id": sc.id,
-            "name": sc.name,
-            "category_id": sc.category_id,
-            "label": f"{sc.category.name} - {sc.name}" if sc.category else sc.name,
-        }
-        for sc in subcategories
-    ]
-
-    return render_template("assets/create.html", form=form, subcategory_options=subcategory_options)
+    return render_template(
+        "assets/create.html", form=form, subcategory_options=get_subcategory_options()
+    )
 
 
 @bp.route("/<int:asset_id>/edit", methods=["GET", "POST"])
 @admin_required
 def edit_asset(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
 
     form = AssetForm(obj=asset)
     _populate_form_choices(form)
@@ -427,25 +688,34 @@ def edit_asset(asset_id):
     if form.errors and request.method == "POST":
         flash("Please correct the errors in the form.", "danger")
 
-    subcategories = SubCategory.query.order_by(SubCategory.name).all()
-    subcategory_options = [
-        {
-            "id": sc.id,
-            "name": sc.name,
-            "category_id": sc.category_id,
-            "label": f"{sc.category.name} - {sc.name}" if sc.category else sc.name,
-        }
-        for sc in subcategories
-    ]
-
-    return render_template("assets/create.html", form=form, is_edit=True, asset=asset, subcategory_options=subcategory_options)
+    return render_template(
+        "assets/create.html",
+        form=form,
+        is_edit=True,
+        asset=asset,
+        subcategory_options=get_subcategory_options(),
+    )
 
 
 @bp.route("/<int:asset_id>")
 @login_required
 def asset_detail(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
-    ensure_vendor_code(asset.vendor)
+    asset = (
+        Asset.query
+        .options(
+            joinedload(Asset.category),
+            joinedload(Asset.subcategory),
+            joinedload(Asset.location),
+            joinedload(Asset.vendor),
+        )
+        .filter(Asset.id == asset_id)
+        .first_or_404()
+    )
+    # Vendor codes are assigned when vendors are created (and backfilled by
+    # the vendors list view), so the detail page is a pure read — no more
+    # full vendor scan + commit per view.
+    # AssetEvent.performed_by / from_location / to_location are declared
+    # lazy="joined" on the model, so this is a single query.
     events = (
         AssetEvent.query
         .filter_by(asset_id=asset.id)
@@ -465,7 +735,7 @@ def retire_asset(asset_id):
 @bp.route("/<int:asset_id>/dispose", methods=["POST"])
 @admin_required
 def dispose_asset(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
 
     if asset.status == "disposed":
         flash("Asset is already disposed.", "warning")
@@ -494,7 +764,7 @@ def dispose_asset(asset_id):
 @bp.route("/<int:asset_id>/assign", methods=["POST"])
 @admin_required
 def assign_asset(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
 
     if asset.status in ["disposed", "repair", "missing", "damaged"]:
         flash("Cannot assign an asset that is disposed, under repair, missing, or damaged.", "danger")
@@ -514,7 +784,7 @@ def assign_asset(asset_id):
     asset.assigned_to = assigned_to
     asset.assigned_department = assigned_department or None
     asset.assigned_email = assigned_email or None
-    asset.assigned_at = date.today()
+    asset.assigned_at = _today()
 
     if asset.status in ["in_stock", "in_use"]:
         asset.status = "assigned"
@@ -543,7 +813,7 @@ def assign_asset(asset_id):
 @bp.route("/<int:asset_id>/unassign", methods=["POST"])
 @admin_required
 def unassign_asset(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
 
     if not asset.assigned_to and not asset.assigned_at:
         flash("This asset is not currently assigned.", "warning")
@@ -579,7 +849,7 @@ def unassign_asset(asset_id):
 @bp.route("/<int:asset_id>/repair/start", methods=["GET", "POST"])
 @admin_required
 def start_repair(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
     vendors = Vendor.query.order_by(Vendor.name.asc()).all()
 
     if asset.status in ["disposed", "missing"]:
@@ -645,7 +915,7 @@ def start_repair(asset_id):
         old_status = asset.status
         old_location_id = asset.location_id
 
-        asset.repair_opened_at = date.today()
+        asset.repair_opened_at = _today()
         asset.repair_vendor = resolved_vendor_name or None
         asset.repair_vendor_phone = resolved_vendor_phone or None
         asset.repair_vendor_address = resolved_vendor_address or None
@@ -693,7 +963,7 @@ def start_repair(asset_id):
 @bp.route("/<int:asset_id>/repair/complete", methods=["GET", "POST"])
 @admin_required
 def complete_repair(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
 
     if asset.status != "repair":
         flash("This asset is not currently under repair.", "warning")
@@ -710,12 +980,15 @@ def complete_repair(asset_id):
         cost_value = None
         if repair_cost:
             try:
-                cost_value = float(repair_cost)
-            except ValueError:
+                cost_value = Decimal(repair_cost)
+            except InvalidOperation:
                 flash("Repair cost must be a number.", "danger")
-                return redirect(url_for("assets.complete_repair", asset_id=asset.id))
+                # Re-render in place instead of redirecting: saves the
+                # extra request/parse hop and keeps the submitted outcome
+                # and notes in the form (the template echoes request.form).
+                return render_template("assets/repair_complete.html", asset=asset)
 
-        asset.repair_closed_at = date.today()
+        asset.repair_closed_at = _today()
         if cost_value is not None:
             asset.repair_cost = cost_value
         if repair_notes:
@@ -750,7 +1023,7 @@ def complete_repair(asset_id):
 @bp.route("/<int:asset_id>/move", methods=["GET", "POST"])
 @admin_required
 def move_asset(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
     locations = Location.query.order_by(Location.name).all()
 
     if request.method == "POST":
@@ -768,6 +1041,12 @@ def move_asset(asset_id):
             flash("Asset is already in this location.", "warning")
             return redirect(url_for("assets.move_asset", asset_id=asset.id))
 
+        # Verify the target exists up front (SQLite won't always enforce
+        # the FK) so a stale form can't write a dangling location_id.
+        if not db.session.query(Location.id).filter_by(id=new_location_id_int).scalar():
+            flash("Please select a valid location.", "danger")
+            return redirect(url_for("assets.move_asset", asset_id=asset.id))
+
         old_location_id = asset.location_id
         asset.location_id = new_location_id_int
 
@@ -797,14 +1076,14 @@ def move_asset(asset_id):
 @bp.route("/<int:asset_id>/label")
 @login_required
 def asset_label(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
     return render_template("assets/label.html", asset=asset)
 
 
 @bp.route("/<int:asset_id>/delete", methods=["POST"])
 @admin_required
 def delete_asset(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
     asset_label = asset.asset_tag or asset.name
 
     db.session.delete(asset)
@@ -816,7 +1095,7 @@ def delete_asset(asset_id):
 @bp.route("/<int:asset_id>/mark-damaged", methods=["POST"])
 @admin_required
 def mark_damaged(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
     old_status = asset.status
 
     if asset.status == "disposed":
@@ -843,7 +1122,7 @@ def mark_damaged(asset_id):
 @bp.route("/<int:asset_id>/mark-missing", methods=["POST"])
 @admin_required
 def mark_missing(asset_id):
-    asset = Asset.query.get_or_404(asset_id)
+    asset = db.get_or_404(Asset, asset_id)
     old_status = asset.status
 
     if asset.status == "disposed":
@@ -890,36 +1169,67 @@ EXPORT_HEADERS = [
 ALLOWED_STATUSES = {"in_stock", "assigned", "repair", "damaged", "missing", "disposed", "in_use"}  # include legacy in_use
 
 
-@admin_required
-def export_assets_csv(assets):
-    """Return a CSV response for the given assets list."""
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(EXPORT_HEADERS)
-
-    for a in assets:
-        writer.writerow([
-            a.asset_tag or "",
-            a.name or "",
-            a.status or "",
-            a.category.code if a.category else "",
-            a.subcategory.name if a.subcategory else "",
-            a.location.code if a.location else "",
-            a.vendor.name if a.vendor else "",
-            a.serial_number or "",
-            a.purchase_date or "",
-            a.warranty_expiry_date or "",
-            a.cost or "",
-            (a.description or "").replace("\n", " ").strip(),
-            (a.notes or "").replace("\n", " ").strip(),
-        ])
-
-    csv_data = output.getvalue()
-    output.close()
-
-    from flask import Response
+def _csv_field(value) -> str:
+    """
+    Minimal CSV quoting: most export cells are codes, statuses and dates
+    that need no escaping, so only quote when a delimiter/quote/newline is
+    actually present instead of paying csv.writer's per-cell dialect
+    handling. Output matches csv.writer's default dialect.
+    """
+    if value is None:
+        return ""
+    s = value if type(value) is str else str(value)
+    if '"' in s or "," in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def export_assets_csv(query):
+    """
+    Stream a CSV response for the given asset query. Not a route: the
+    caller (list_assets) enforces the admin check before building the
+    result set.
+
+    Rows come through a yield_per() batched cursor, are serialized with
+    the quote-only-when-needed writer above, and are flushed to the
+    client in ~64 KB chunks, so export memory stays flat regardless of
+    table size and the download starts after the first batch instead of
+    after the whole file is serialized.
+    """
+    from flask import Response, stream_with_context
+
+    def generate():
+        parts = [",".join(EXPORT_HEADERS) + "\r\n"]
+        size = len(parts[0])
+
+        for a in query.yield_per(500):
+            line = ",".join((
+                _csv_field(a.asset_tag),
+                _csv_field(a.name),
+                _csv_field(a.status),
+                _csv_field(a.category.code if a.category else ""),
+                _csv_field(a.subcategory.name if a.subcategory else ""),
+                _csv_field(a.location.code if a.location else ""),
+                _csv_field(a.vendor.name if a.vendor else ""),
+                _csv_field(a.serial_number),
+                a.purchase_date.isoformat() if a.purchase_date else "",
+                a.warranty_expiry_date.isoformat() if a.warranty_expiry_date else "",
+                _csv_field(a.cost or ""),
+                _csv_field((a.description or "").replace("\n", " ").strip()),
+                _csv_field((a.notes or "").replace("\n", " ").strip()),
+            )) + "\r\n"
+            parts.append(line)
+            size += len(line)
+            if size >= 65536:
+                yield "".join(parts)
+                parts.clear()
+                size = 0
+
+        if parts:
+            yield "".join(parts)
+
     return Response(
-        csv_data,
+        stream_with_context(generate()),
         mimetype="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=assets_export.csv"
@@ -939,39 +1249,106 @@ def import_assets():
             flash("Please upload a CSV file.", "danger")
             return redirect(url_for("assets.import_assets"))
 
+        # Decode row-by-row off the upload stream instead of buffering the
+        # whole file as bytes plus a decoded copy. Plain csv.reader plus
+        # precomputed column indices: DictReader builds and hash-probes a
+        # dict per row, which is measurable on wide files.
+        reader = csv.reader(
+            io.TextIOWrapper(file.stream, encoding="utf-8-sig", newline="")
+        )
         try:
-            content = file.read().decode("utf-8-sig")
-        except Exception:
+            fieldnames = next(reader, None) or []
+            missing_headers = [h for h in ["name", "status", "category_code", "location_code"] if h not in fieldnames]
+            if missing_headers:
+                flash(f"Missing required headers: {', '.join(missing_headers)}", "danger")
+                return redirect(url_for("assets.import_assets"))
+            ncols = len(fieldnames)
+            # Normalize every row to header width plus one shared empty
+            # slot at the end; columns absent from the file map to that
+            # slot, so field access below is always a plain list index.
+            rows = []
+            for r in reader:
+                if len(r) != ncols:
+                    r = r[:ncols] + [""] * (ncols - len(r))
+                r.append("")
+                rows.append(r)
+        except UnicodeDecodeError:
             flash("Could not read the uploaded file. Ensure it is valid UTF-8.", "danger")
             return redirect(url_for("assets.import_assets"))
 
-        reader = csv.DictReader(io.StringIO(content))
-        missing_headers = [h for h in ["name", "status", "category_code", "location_code"] if h not in reader.fieldnames]
-        if missing_headers:
-            flash(f"Missing required headers: {', '.join(missing_headers)}", "danger")
-            return redirect(url_for("assets.import_assets"))
+        col = {h: i for i, h in enumerate(fieldnames)}.get
+        i_name = col("name", ncols)
+        i_status = col("status", ncols)
+        i_category = col("category_code", ncols)
+        i_subcategory = col("subcategory_name", ncols)
+        i_location = col("location_code", ncols)
+        i_vendor = col("vendor_name", ncols)
+        i_tag = col("asset_tag", ncols)
+        i_serial = col("serial_number", ncols)
+        i_purchase = col("purchase_date", ncols)
+        i_warranty = col("warranty_expiry_date", ncols)
+        i_cost = col("cost", ncols)
+        i_description = col("description", ncols)
+        i_notes = col("notes", ncols)
+
+        # Pre-fetch every lookup the file references in a handful of IN
+        # queries and resolve rows against dicts, instead of up to five
+        # SELECTs per row.
+        cat_codes = {r[i_category].strip().upper() for r in rows} - {""}
+        loc_codes = {r[i_location].strip().upper() for r in rows} - {""}
+        vendor_names = {r[i_vendor].strip() for r in rows} - {""}
+        file_tags = {r[i_tag].strip().upper() for r in rows} - {""}
+
+        categories_by_code = {
+            c.code: c for c in Category.query.filter(Category.code.in_(cat_codes))
+        }
+        locations_by_code = {
+            l.code: l for l in Location.query.filter(Location.code.in_(loc_codes))
+        }
+        vendors_by_name = {
+            name: vid
+            for vid, name in db.session.query(Vendor.id, Vendor.name).filter(
+                Vendor.name.in_(vendor_names)
+            )
+        }
+        subcats_by_key = {
+            (s.category_id, s.name): s
+            for s in SubCategory.query.filter(
+                SubCategory.category_id.in_([c.id for c in categories_by_code.values()])
+            )
+        }
+        existing_tags = {
+            tag
+            for (tag,) in db.session.query(Asset.asset_tag).filter(
+                Asset.asset_tag.in_(file_tags)
+            )
+        }
 
-        created = 0
+        asset_rows = []
         errors = []
+        seen_tags = set()  # explicit tags seen earlier in this file
+        pending_vendor_rows = []  # (asset_rows index, new vendor name)
+        pending_tag_rows = []  # (asset_rows index, office code, category code)
         row_num = 1  # header
+        performed_by_id = current_user.id if current_user.is_authenticated else None
 
-        for row in reader:
+        for row in rows:
             row_num += 1
-            name = (row.get("name") or "").strip()
-            status = (row.get("status") or "").strip().lower() or "in_stock"
+            name = row[i_name].strip()
+            status = row[i_status].strip().lower() or "in_stock"
             if status == "in_use":
                 status = "assigned"
-            category_code = (row.get("category_code") or "").strip().upper()
-            subcategory_name = (row.get("subcategory_name") or "").strip()
-            location_code = (row.get("location_code") or "").strip().upper()
-            vendor_name = (row.get("vendor_name") or "").strip()
-            asset_tag = (row.get("asset_tag") or "").strip()
-            serial_number = (row.get("serial_number") or "").strip()
-            purchase_date_raw = (row.get("purchase_date") or "").strip()
-            warranty_date_raw = (row.get("warranty_expiry_date") or "").strip()
-            cost_raw = (row.get("cost") or "").strip()
-            description = (row.get("description") or "").strip()
-            notes = (row.get("notes") or "").strip()
+            category_code = row[i_category].strip().upper()
+            subcategory_name = row[i_subcategory].strip()
+            location_code = row[i_location].strip().upper()
+            vendor_name = row[i_vendor].strip()
+            asset_tag = row[i_tag].strip().upper()
+            serial_number = row[i_serial].strip()
+            purchase_date_raw = row[i_purchase].strip()
+            warranty_date_raw = row[i_warranty].strip()
+            cost_raw = row[i_cost].strip()
+            description = row[i_description].strip()
+            notes = row[i_notes].strip()
 
             if not name:
                 errors.append(f"Row {row_num}: name is required.")
@@ -989,49 +1366,42 @@ def import_assets():
                 errors.append(f"Row {row_num}: location_code is required.")
                 continue
 
-            category = Category.query.filter_by(code=category_code).first()
+            category = categories_by_code.get(category_code)
             if not category:
                 errors.append(f"Row {row_num}: category code '{category_code}' not found.")
                 continue
 
-            location = Location.query.filter_by(code=location_code).first()
+            location = locations_by_code.get(location_code)
             if not location:
                 errors.append(f"Row {row_num}: location code '{location_code}' not found.")
                 continue
 
             subcategory = None
             if subcategory_name:
-                subcategory = (
-                    SubCategory.query
-                    .filter(SubCategory.name == subcategory_name, SubCategory.category_id == category.id)
-                    .first()
-                )
+                subcategory = subcats_by_key.get((category.id, subcategory_name))
                 if not subcategory:
                     errors.append(f"Row {row_num}: subcategory '{subcategory_name}' not found under category '{category_code}'.")
                     continue
 
-            vendor = None
-            if vendor_name:
-                vendor = Vendor.query.filter_by(name=vendor_name).first()
-                if not vendor:
-                    vendor = Vendor(name=vendor_name)
-                    db.session.add(vendor)
-                    db.session.flush()
+            # Unknown vendors are only noted here; they get inserted in one
+            # batch after validation so a failed import writes nothing.
+            vendor_id = vendors_by_name.get(vendor_name) if vendor_name else None
 
             # Dates
-            def parse_date(val, label):
-                if not val:
-                    return None
-                try:
-                    return datetime.strptime(val, "%Y-%m-%d").date()
-                except ValueError:
-                    errors.append(f"Row {row_num}: {label} must be YYYY-MM-DD.")
-                    return None
-
-            purchase_date = parse_date(purchase_date_raw, "purchase_date")
-            warranty_date = parse_date(warranty_date_raw, "warranty_expiry_date")
-
-            if any(err.startswith(f"Row {row_num}:") for err in errors):
+            purchase_date = warranty_date = None
+            date_error = False
+            if purchase_date_raw:
+                purchase_date = _parse_iso_date(purchase_date_raw)
+                if purchase_date is None:
+                    errors.append(f"Row {row_num}: purchase_date must be YYYY-MM-DD.")
+                    date_error = True
+            if warranty_date_raw:
+                warranty_date = _parse_iso_date(warranty_date_raw)
+                if warranty_date is None:
+                    errors.append(f"Row {row_num}: warranty_expiry_date must be YYYY-MM-DD.")
+                    date_error = True
+
+            if date_error:
                 continue
 
             # Cost
@@ -1045,53 +1415,104 @@ def import_assets():
 
             # Asset tag
             if asset_tag:
-                existing = Asset.query.filter_by(asset_tag=asset_tag).first()
-                if existing:
+                if asset_tag in existing_tags:
                     errors.append(f"Row {row_num}: asset_tag '{asset_tag}' already exists.")
                     continue
+                if asset_tag in seen_tags:
+                    errors.append(f"Row {row_num}: asset_tag '{asset_tag}' appears more than once in the file.")
+                    continue
+                seen_tags.add(asset_tag)
             else:
-                try:
-                    asset_tag = generate_asset_tag(location, category, date.today().year)
-                except Exception as exc:
-                    errors.append(f"Row {row_num}: could not generate tag ({exc}).")
+                # Tags are allocated in blocks after validation — one
+                # sequence upsert per office instead of one per row.
+                office_code = (location.code or "").strip().upper()
+                cat_code = (category.code or "").strip().upper()
+                if not office_code or not cat_code:
+                    errors.append(f"Row {row_num}: could not generate tag (location or category code missing).")
                     continue
-
-            asset = Asset(
-                asset_tag=asset_tag,
-                name=name,
-                status=status,
-                category_id=category.id,
-                subcategory_id=subcategory.id if subcategory else None,
-                location_id=location.id,
-                vendor_id=vendor.id if vendor else None,
-                serial_number=serial_number or None,
-                purchase_date=purchase_date,
-                warranty_expiry_date=warranty_date,
-                cost=cost_val,
-                description=description or None,
-                notes=notes or None,
-            )
-            db.session.add(asset)
-            db.session.flush()
-
-            log_asset_event(
-                asset=asset,
-                event_type="created",
-                note="Asset imported via CSV",
-                to_status=asset.status,
-                to_location_id=asset.location_id,
-            )
-
-            created += 1
+                pending_tag_rows.append((len(asset_rows), office_code, cat_code))
+                asset_tag = None
+
+            if vendor_name and vendor_id is None:
+                pending_vendor_rows.append((len(asset_rows), vendor_name))
+
+            asset_rows.append({
+                "asset_tag": asset_tag,
+                "name": name,
+                "status": status,
+                "category_id": category.id,
+                "subcategory_id": subcategory.id if subcategory else None,
+                "location_id": location.id,
+                "vendor_id": vendor_id,
+                "serial_number": serial_number or None,
+                "purchase_date": purchase_date,
+                "warranty_expiry_date": warranty_date,
+                "cost": cost_val,
+                "description": description or None,
+                "notes": notes or None,
+            })
 
         if errors:
             db.session.rollback()
             for err in errors:
                 flash(err, "danger")
-            if created:
-                flash(f"{created} assets were created before errors occurred; nothing was saved. Fix errors and try again.", "warning")
+            if asset_rows:
+                flash(f"{len(asset_rows)} assets were valid before errors occurred; nothing was saved. Fix errors and try again.", "warning")
             return redirect(url_for("assets.import_assets"))
 
+        if pending_vendor_rows:
+            # Insert each new vendor name once, then patch the ids back into
+            # the rows that referenced it.
+            new_vendor_names = sorted({name for _, name in pending_vendor_rows})
+            result = db.session.execute(
+                insert(Vendor).returning(
+                    Vendor.id, Vendor.name, sort_by_parameter_order=True
+                ),
+                [{"name": name} for name in new_vendor_names],
+            )
+            vendors_by_name.update({name: vid for vid, name in result})
+            for idx, name in pending_vendor_rows:
+                asset_rows[idx]["vendor_id"] = vendors_by_name[name]
+
+        if pending_tag_rows:
+            # Sequences are per office/year, so one block allocation per
+            # office covers every generated tag in the file; the numbers
+            # are then assigned to rows in file order.
+            year = _today().year
+            company = _company_prefix()
+            by_office = defaultdict(list)
+            for idx, office_code, cat_code in pending_tag_rows:
+                by_office[office_code].append((idx, cat_code))
+            for office_code, entries in by_office.items():
+                first = _next_sequence_value(office_code, year, count=len(entries))
+                for seq, (idx, cat_code) in enumerate(entries, start=first):
+                    asset_rows[idx]["asset_tag"] = (
+                        f"{company}-{office_code}-{cat_code}-{year}-{seq:04d}"
+                    )
+
+        created = len(asset_rows)
+        if asset_rows:
+            # One batched multi-row INSERT for the assets (ids returned in
+            # parameter order) and one executemany for their created-events,
+            # instead of two statements per row.
+            result = db.session.execute(
+                insert(Asset).returning(Asset.id, sort_by_parameter_order=True),
+                asset_rows,
+            )
+            log_asset_events_bulk(
+                [
+                    {
+                        "asset_id": asset_id,
+                        "event_type": "created",
+                        "note": "Asset imported via CSV",
+                        "to_status": mapping["status"],
+                        "to_location_id": mapping["location_id"],
+                        "performed_by_id": performed_by_id,
+                    }
+                    for (asset_id,), mapping in zip(result, asset_rows)
+                ]
+            )
+
         db.session.commit()
         flash(f"Imported {created} assets successfully.", "success")
         return redirect(url_for("assets.list_assets"))
@@ -3,6 +3,7 @@ from flask_migrate import Migrate
 from flask_wtf import CSRFProtect
 from flask_login import LoginManager
 from flask_wtf.csrf import generate_csrf
+from sqlalchemy import event
 
 
 db = SQLAlchemy()
@@ -14,9 +15,26 @@ login_manager.login_view = "auth.login"
 login_manager.login_message_category = "warning"
 
 
+def _set_sqlite_pragmas(dbapi_conn, _record):
+    """
+    Tune each new SQLite connection: WAL avoids writer/reader blocking and
+    synchronous=NORMAL drops the per-commit fsync (safe under WAL).
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 def init_extensions(app):
     db.init_app(app)
     migrate.init_app(app, db)
+
+    if app.config.get("SQLALCHEMY_DATABASE_URI", "").startswith("sqlite"):
+        with app.app_context():
+            event.listens_for(db.engine, "connect")(_set_sqlite_pragmas)
     csrf.init_app(app)
     login_manager.init_app(app)
 
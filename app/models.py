@@ -86,12 +86,23 @@ class Vendor(TimestampMixin, db.Model):
 
     assets = db.relationship("Asset", back_populates="vendor")
 
+    __table_args__ = (
+        # Repair flows look vendors up with lower(name) = :name; the
+        # expression index turns that from a table scan into a probe.
+        db.Index("ix_vendors_lower_name", db.func.lower(name)),
+    )
+
     def __repr__(self):
         return f"<Vendor {self.name}>"
 
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 
+# scrypt runs in OpenSSL's native code paths instead of the pure-Python
+# PBKDF2 loop, so bulk user creation / password resets stay cheap. Old
+# pbkdf2 hashes keep verifying via check_password_hash.
+PASSWORD_HASH_METHOD = "scrypt"
+
 
 class User(UserMixin, TimestampMixin, db.Model):
     __tablename__ = "users"
@@ -105,9 +116,13 @@ class User(UserMixin, TimestampMixin, db.Model):
     is_admin = db.Column(db.Boolean, default=True, nullable=False)
 
     def set_password(self, password: str):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def check_password(self, password: str) -> bool:
+        # Reject placeholder/malformed hashes (e.g. a seed whose real hash
+        # is still being computed) instead of letting werkzeug raise.
+        if "$" not in (self.password_hash or ""):
+            return False
         return check_password_hash(self.password_hash, password)
 
     def __repr__(self):
@@ -167,12 +182,71 @@ class Asset(TimestampMixin, db.Model):
         lazy="dynamic",
         order_by="AssetEvent.created_at.desc()",
         cascade="all, delete-orphan",
-    )  
-    
+    )
+
+    __table_args__ = (
+        # Covers the list view's status/location filters with its default
+        # newest-first ordering; asset_tag prefix scans use the existing
+        # unique index on asset_tag.
+        db.Index("ix_assets_status_location_id", status, location_id, id.desc()),
+        # Status-only filter with the default newest-first sort.
+        db.Index("ix_assets_status_id", status, id.desc()),
+        # Location filter over non-terminal statuses (the common working
+        # set); partial so disposed/missing history doesn't bloat it.
+        db.Index(
+            "ix_assets_active_location_id",
+            location_id,
+            id.desc(),
+            sqlite_where=status.in_(["in_stock", "assigned", "in_use"]),
+        ),
+    )
+
     def __repr__(self):
         return f"<Asset {self.name} ({self.status})>"
 
 
+# Trigram FTS5 mirror of the three columns the list search matches with
+# infix LIKE patterns, which no btree index can serve. LIKE over the FTS
+# table's columns is answered from the trigram index (SQLite >= 3.34)
+# with the same case-insensitive substring semantics. External-content
+# mode stores only the index; the triggers keep it in sync and fire only
+# when an indexed column actually changes. Attached to the assets table's
+# create event so the first-boot create_all() path builds it too; existing
+# databases get it from the matching Alembic migration.
+_ASSETS_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE assets_fts USING fts5(
+        name, asset_tag, serial_number,
+        content='assets', content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER assets_fts_ai AFTER INSERT ON assets BEGIN
+        INSERT INTO assets_fts(rowid, name, asset_tag, serial_number)
+        VALUES (new.id, new.name, new.asset_tag, new.serial_number);
+    END
+    """,
+    """
+    CREATE TRIGGER assets_fts_ad AFTER DELETE ON assets BEGIN
+        INSERT INTO assets_fts(assets_fts, rowid, name, asset_tag, serial_number)
+        VALUES ('delete', old.id, old.name, old.asset_tag, old.serial_number);
+    END
+    """,
+    """
+    CREATE TRIGGER assets_fts_au AFTER UPDATE OF name, asset_tag, serial_number ON assets BEGIN
+        INSERT INTO assets_fts(assets_fts, rowid, name, asset_tag, serial_number)
+        VALUES ('delete', old.id, old.name, old.asset_tag, old.serial_number);
+        INSERT INTO assets_fts(rowid, name, asset_tag, serial_number)
+        VALUES (new.id, new.name, new.asset_tag, new.serial_number);
+    END
+    """,
+)
+
+for _stmt in _ASSETS_FTS_DDL:
+    db.event.listen(Asset.__table__, "after_create", db.DDL(_stmt))
+
+
 class AssetEvent(db.Model):
     __tablename__ = "asset_events"
 
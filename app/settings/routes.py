@@ -1,4 +1,4 @@
-from flask import render_template, redirect, url_for, flash, request
+from flask import render_template, redirect, url_for, flash, request, g, has_app_context
 from flask_login import login_required
 from wtforms import StringField, SubmitField
 from wtforms.validators import DataRequired, Email, Length, Optional
@@ -16,9 +16,23 @@ from app.assets.routes import EXPORT_HEADERS
 
 
 def get_setting_value(key: str, default=None):
-    setting = Setting.query.filter_by(key=key).first()
-    if setting and setting.value is not None:
-        return setting.value
+    """
+    Look up a setting value, memoized per request/app context so templates
+    calling get_setting() several times per render hit the DB only once
+    per key.
+    """
+    if has_app_context():
+        cache = g.setdefault("_setting_cache", {})
+        if key not in cache:
+            setting = Setting.query.filter_by(key=key).first()
+            cache[key] = setting.value if setting else None
+        value = cache[key]
+    else:
+        setting = Setting.query.filter_by(key=key).first()
+        value = setting.value if setting else None
+
+    if value is not None:
+        return value
     return default
 
 
@@ -29,6 +43,9 @@ def set_setting_value(key: str, value):
         db.session.add(setting)
     else:
         setting.value = value
+    # Keep the per-request memo in sync with the write
+    if has_app_context():
+        g.setdefault("_setting_cache", {})[key] = value
     return setting
 
 
@@ -83,8 +100,6 @@ def general_settings():
         form.support_email.data = get_setting_value("support_email", "")
         form.asset_tag_prefix.data = get_setting_value("asset_tag_prefix", "ESS-")
 
-    from app.assets.routes import EXPORT_HEADERS
-
     return render_template(
         "settings/index.html",
         form=form,
@@ -97,7 +112,6 @@ def general_settings():
 @login_required
 @admin_required
 def import_export():
-    from app.assets.routes import EXPORT_HEADERS  # reuse headers
     return render_template("settings/import_export.html", headers=EXPORT_HEADERS)
 
 
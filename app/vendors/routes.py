@@ -1,4 +1,5 @@
 from flask import render_template, redirect, url_for, flash, abort
+from sqlalchemy import func, Integer
 from . import bp
 from app.extensions import db
 from app.models import Vendor
@@ -33,17 +34,20 @@ def _current_max_code_number():
     Get the largest numeric suffix among vendor codes that match V###.
     Ignores legacy / non-standard codes so they don't inflate the sequence.
     """
-    max_num = 0
-    existing_codes = (
-        Vendor.query.with_entities(Vendor.code).filter(Vendor.code.isnot(None)).all()
+    # Filter and parse in SQL: one integer comes back instead of every
+    # code. The second GLOB rejects codes with non-digit suffixes so the
+    # legacy-skipping behavior matches the old Python loop.
+    code_upper = func.upper(Vendor.code)
+    suffix = func.substr(code_upper, 2)
+    return (
+        db.session.query(func.max(func.cast(suffix, Integer)))
+        .filter(
+            code_upper.op("GLOB")("V[0-9]*"),
+            ~suffix.op("GLOB")("*[^0-9]*"),
+        )
+        .scalar()
+        or 0
     )
-    for (code,) in existing_codes:
-        if not code:
-            continue
-        code_upper = code.upper().strip()
-        if code_upper.startswith("V") and code_upper[1:].isdigit():
-            max_num = max(max_num, int(code_upper[1:]))
-    return max_num
 
 
 def _generate_vendor_code():
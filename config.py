@@ -21,3 +21,18 @@ class Config:
     SECRET_KEY = os.environ.get("SECRET_KEY", "dev-change-me")  # change in production
     SQLALCHEMY_DATABASE_URI = _db_uri()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # The embedded server handles requests on threads sharing one engine;
+    # size the pool above SQLAlchemy's default of 5 so a burst of parallel
+    # page loads queues on SQLite's own locking (cheap under WAL) instead
+    # of on connection checkout. pre_ping/recycle are deliberately left
+    # out: embedded SQLite connections don't go stale the way network
+    # database connections do.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 10,
+    }
+    # Tokens live as long as the session; skips the timestamp check on
+    # every form POST and avoids spurious "token expired" failures in the
+    # long-running desktop window.
+    WTF_CSRF_TIME_LIMIT = None
@@ -0,0 +1,57 @@
+"""Add trigram FTS5 table for asset search
+
+Revision ID: a9d4c7f21b36
+Revises: f1b7c3e8d204
+Create Date: 2026-09-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d4c7f21b36'
+down_revision = 'f1b7c3e8d204'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE VIRTUAL TABLE assets_fts USING fts5("
+        "name, asset_tag, serial_number, "
+        "content='assets', content_rowid='id', "
+        "tokenize='trigram')"
+    )
+    op.execute(
+        "CREATE TRIGGER assets_fts_ai AFTER INSERT ON assets BEGIN "
+        "INSERT INTO assets_fts(rowid, name, asset_tag, serial_number) "
+        "VALUES (new.id, new.name, new.asset_tag, new.serial_number); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER assets_fts_ad AFTER DELETE ON assets BEGIN "
+        "INSERT INTO assets_fts(assets_fts, rowid, name, asset_tag, serial_number) "
+        "VALUES ('delete', old.id, old.name, old.asset_tag, old.serial_number); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER assets_fts_au AFTER UPDATE OF name, asset_tag, serial_number ON assets BEGIN "
+        "INSERT INTO assets_fts(assets_fts, rowid, name, asset_tag, serial_number) "
+        "VALUES ('delete', old.id, old.name, old.asset_tag, old.serial_number); "
+        "INSERT INTO assets_fts(rowid, name, asset_tag, serial_number) "
+        "VALUES (new.id, new.name, new.asset_tag, new.serial_number); "
+        "END"
+    )
+    # Backfill the index from existing rows.
+    op.execute(
+        "INSERT INTO assets_fts(rowid, name, asset_tag, serial_number) "
+        "SELECT id, name, asset_tag, serial_number FROM assets"
+    )
+
+
+def downgrade():
+    op.execute("DROP TRIGGER assets_fts_au")
+    op.execute("DROP TRIGGER assets_fts_ad")
+    op.execute("DROP TRIGGER assets_fts_ai")
+    op.execute("DROP TABLE assets_fts")
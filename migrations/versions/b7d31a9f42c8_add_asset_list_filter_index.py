@@ -0,0 +1,28 @@
+"""Add composite index for asset list filters
+
+Revision ID: b7d31a9f42c8
+Revises: 8c5c77c6f3c0
+Create Date: 2026-09-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d31a9f42c8'
+down_revision = '8c5c77c6f3c0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_assets_status_location_id',
+        'assets',
+        ['status', 'location_id', sa.text('id DESC')],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_assets_status_location_id', table_name='assets')
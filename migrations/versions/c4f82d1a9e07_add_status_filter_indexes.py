@@ -0,0 +1,35 @@
+"""Add status filter indexes for the asset list
+
+Revision ID: c4f82d1a9e07
+Revises: b7d31a9f42c8
+Create Date: 2026-09-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f82d1a9e07'
+down_revision = 'b7d31a9f42c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_assets_status_id',
+        'assets',
+        ['status', sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_assets_active_location_id',
+        'assets',
+        ['location_id', sa.text('id DESC')],
+        sqlite_where=sa.text("status IN ('in_stock', 'assigned', 'in_use')"),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_assets_active_location_id', table_name='assets')
+    op.drop_index('ix_assets_status_id', table_name='assets')
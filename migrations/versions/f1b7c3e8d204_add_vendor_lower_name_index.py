@@ -0,0 +1,28 @@
+"""Add expression index on lower(vendors.name)
+
+Revision ID: f1b7c3e8d204
+Revises: c4f82d1a9e07
+Create Date: 2026-09-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b7c3e8d204'
+down_revision = 'c4f82d1a9e07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_vendors_lower_name',
+        'vendors',
+        [sa.text('lower(name)')],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_vendors_lower_name', table_name='vendors')
@@ -0,0 +1,63 @@
+"""
+Shared fixtures for the query-budget regression tests.
+
+The app factory reads INVENTORY_DATA_DIR at config-import time, so the
+fixture is session-scoped around one temporary data directory; each
+session starts from an empty database seeded by the tests themselves.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(engine):
+    """
+    Collect every statement the engine executes inside the block. Used to
+    pin an upper bound on per-request query counts so N+1 regressions
+    fail the build instead of shipping silently.
+    """
+    statements = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    os.environ["INVENTORY_DATA_DIR"] = str(tmp_path_factory.mktemp("invdata"))
+    from app import create_app
+
+    application = create_app()
+    application.config["WTF_CSRF_ENABLED"] = False
+    yield application
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Test client logged in as the seeded admin."""
+    test_client = app.test_client()
+    # The first-boot admin's password hash lands from a background thread
+    # (see _seed_admin), so retry until the login sticks.
+    for _ in range(100):
+        response = test_client.post(
+            "/auth/login",
+            data={"username": "admin", "password": "123456"},
+            follow_redirects=True,
+        )
+        if b"Logged in successfully" in response.data:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("could not log in as the seeded admin")
+    return test_client
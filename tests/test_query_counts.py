@@ -0,0 +1,83 @@
+"""
+Per-request query budgets for the hot read paths.
+
+Each test warms the request once (choices cache, settings, session user)
+and then asserts a hard ceiling on the number of statements the next
+request issues. The ceilings are the measured steady-state counts; if a
+change reintroduces per-row lazy loads in the list, detail or form
+views, these fail rather than letting the N+1 ship.
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models import Asset, Category, Location, SubCategory, Vendor
+
+from .conftest import count_queries
+
+
+@pytest.fixture(scope="session")
+def seeded_assets(app):
+    """Fifty assets with every relationship populated."""
+    with app.app_context():
+        category = Category(name="Computers", code="COMP")
+        location = Location(name="Main Office", code="M")
+        vendor = Vendor(name="Acme Supplies")
+        db.session.add_all([category, location, vendor])
+        db.session.flush()
+        subcategory = SubCategory(name="Laptops", category_id=category.id)
+        db.session.add(subcategory)
+        db.session.flush()
+        for n in range(50):
+            db.session.add(
+                Asset(
+                    name=f"Laptop {n:02d}",
+                    asset_tag=f"ESS-M-COMP-2026-{n + 1:04d}",
+                    serial_number=f"SN-{n:05d}",
+                    status="in_stock",
+                    category_id=category.id,
+                    subcategory_id=subcategory.id,
+                    location_id=location.id,
+                    vendor_id=vendor.id,
+                )
+            )
+        db.session.commit()
+        first_id = db.session.query(db.func.min(Asset.id)).scalar()
+    return first_id
+
+
+def _engine(app):
+    with app.app_context():
+        return db.engine
+
+
+def test_list_assets_query_budget(app, client, seeded_assets):
+    client.get("/assets/")  # warm caches
+    with count_queries(_engine(app)) as statements:
+        response = client.get("/assets/")
+    assert response.status_code == 200
+    assert b"Laptop 49" in response.data
+    # session user + rows + count + choices fingerprint + settings; a
+    # per-row lazy load would add ~50 statements here.
+    assert len(statements) <= 6, statements
+
+
+def test_asset_form_query_budget(app, client, seeded_assets):
+    client.get("/assets/new")
+    with count_queries(_engine(app)) as statements:
+        response = client.get("/assets/new")
+    assert response.status_code == 200
+    # session user + choices fingerprint + settings; the four dropdown
+    # lists come from the version cache without touching the database.
+    assert len(statements) <= 5, statements
+
+
+def test_asset_detail_query_budget(app, client, seeded_assets):
+    url = f"/assets/{seeded_assets}"
+    client.get(url)
+    with count_queries(_engine(app)) as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    # session user + eager-loaded asset + events + settings; event
+    # lookups (performed_by, locations) ride the events query.
+    assert len(statements) <= 6, statements